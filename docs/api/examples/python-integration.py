@@ -6,17 +6,39 @@ using Python. Suitable for clinic management systems, EMR integrations, and
 custom therapist dashboards.
 
 Requirements:
-    pip install requests
+    Python 3.10+
+    pip install "httpx[http2,brotli]" msgspec
 
 Usage:
     python python-integration.py
 """
 
-import requests
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import httpx
+import msgspec
+from msgspec.structs import force_setattr
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from enum import Enum
 
+# Templates are reference data, so clients keep recently fetched ones in memory
+TEMPLATE_CACHE_SIZE = 1024
+LIBRARY_STATS_TTL = 60.0  # seconds
+TEMPLATE_BATCH_SIZE = 100  # max IDs per GET /templates?ids= request
+
+# Idle connections stay pooled for 30s so bursts reuse warm TLS sessions
+# instead of reconnecting
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=30.0
+)
+
 
 class ExerciseCategory(str, Enum):
     STRENGTH = "strength"
@@ -27,6 +49,10 @@ class ExerciseCategory(str, Enum):
     FUNCTIONAL = "functional"
     REHABILITATION = "rehabilitation"
 
+    # Render as the raw value so members can be passed straight to httpx
+    # params (which calls str()) instead of going through .value
+    __str__ = str.__str__
+
 
 class PrescriptionStatus(str, Enum):
     ACTIVE = "active"
@@ -34,26 +60,40 @@ class PrescriptionStatus(str, Enum):
     PAUSED = "paused"
     CANCELLED = "cancelled"
 
+    __str__ = str.__str__
+
+
+# Plain strings are accepted wherever an enum is expected; these sets validate
+# them with a single hash lookup
+_VALID_CATEGORIES = frozenset(category.value for category in ExerciseCategory)
+_VALID_STATUSES = frozenset(status.value for status in PrescriptionStatus)
 
-@dataclass
-class ExerciseTemplate:
+# Known category/status values map to their shared enum members, so large
+# pages don't hold a separate "active" string per prescription
+_CATEGORY_MEMBERS = {category.value: category for category in ExerciseCategory}
+_STATUS_MEMBERS = {status.value: status for status in PrescriptionStatus}
+
+
+class ExerciseTemplate(msgspec.Struct, rename="camel", frozen=True):
     """Exercise template model"""
     id: str
     name: str
     description: str
-    category: str
+    category: str  # an ExerciseCategory member unless the value is unknown
     difficulty: int
     body_region: str
-    primary_joints: List[str]
+    primary_joints: tuple[str, ...]
     estimated_duration: int
     recommended_reps: int
     recommended_sets: int
     patient_instructions: str
     active: bool
 
+    def __post_init__(self):
+        force_setattr(self, "category", _CATEGORY_MEMBERS.get(self.category, self.category))
+
 
-@dataclass
-class ExercisePrescription:
+class ExercisePrescription(msgspec.Struct, rename="camel", frozen=True):
     """Exercise prescription model"""
     id: str
     template_id: str
@@ -64,21 +104,235 @@ class ExercisePrescription:
     reps: int
     sets: int
     frequency_per_week: int
-    status: str
+    status: str  # a PrescriptionStatus member unless the value is unknown
     completion_percent: int
 
+    def __post_init__(self):
+        force_setattr(self, "status", _STATUS_MEMBERS.get(self.status, self.status))
+
+
+# ============================================================================
+# Response Decoders
+# ============================================================================
+# msgspec decodes response bodies straight into the models, mapping the API's
+# camelCase keys onto snake_case fields via rename="camel", with no
+# intermediate dict. Keys are matched against the schema compiled into each
+# Decoder. category/status stay typed as str so a value added on the server
+# doesn't fail a whole page; __post_init__ swaps known values for enum members.
+
+class _TemplatePage(msgspec.Struct):
+    """A page of templates; other keys in the response are ignored"""
+    templates: list[ExerciseTemplate]
+
+
+class _PrescriptionPage(msgspec.Struct):
+    """A page of prescriptions; other keys in the response are ignored"""
+    prescriptions: list[ExercisePrescription]
+    total: int | None = None
+
+
+_template_decoder = msgspec.json.Decoder(ExerciseTemplate)
+_prescription_decoder = msgspec.json.Decoder(ExercisePrescription)
+_template_page_decoder = msgspec.json.Decoder(_TemplatePage)
+_prescription_page_decoder = msgspec.json.Decoder(_PrescriptionPage)
+
+
+def _compact(pairs) -> dict:
+    """Build a query/body dict from (key, value) pairs, skipping None values"""
+    return {key: value for key, value in pairs if value is not None}
+
+
+def _batches(items: list[str], size: int) -> list[list[str]]:
+    """Split items into consecutive chunks of at most size"""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _enum_param(
+    value: str | None,
+    enum_cls: type[Enum],
+    valid: frozenset,
+    name: str
+) -> str | None:
+    """Pass enum_cls members through, checking anything else against valid"""
+    if value is None or isinstance(value, enum_cls):
+        return value
+    if not isinstance(value, Enum) and value in valid:
+        return value
+    raise ValueError(f"Invalid {name} {value!r}; expected one of {sorted(valid)}")
+
+
+def _join(values: Sequence[str] | None) -> str | None:
+    """Serialize a list query parameter as comma-separated values"""
+    return ",".join(values) if values is not None else None
+
+
+def _prescription_page_params(
+    status: PrescriptionStatus | str | None,
+    limit: int,
+    offset: int,
+    fields: Sequence[str] | None = None
+) -> dict:
+    """Query params for GET /patients/{patientId}/prescriptions"""
+    return _compact((
+        ("limit", limit),
+        ("offset", offset),
+        ("status", _enum_param(status, PrescriptionStatus, _VALID_STATUSES, "status")),
+        ("fields", _join(fields))
+    ))
+
+
+# ============================================================================
+# Errors
+# ============================================================================
+
+class PhysioAssistAPIError(Exception):
+    """Raised when the API responds with a non-2xx status"""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(response)
+        self.response = response
+        self.status_code = response.status_code
+
+    @property
+    def error(self) -> dict:
+        """The decoded Error body ({code, message, details}), if any"""
+        try:
+            body = msgspec.json.decode(self.response.content)
+        except msgspec.DecodeError:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    def __str__(self) -> str:
+        # Formatted only when the error is displayed, not when it is raised
+        error = self.error
+        request = self.response.request
+        summary = error.get("code", self.response.reason_phrase)
+        if error.get("message"):
+            summary = f"{summary}: {error['message']}"
+        return f"{self.status_code} {summary} ({request.method} {request.url})"
+
+
+def _check(response: httpx.Response) -> None:
+    """Raise PhysioAssistAPIError for any non-2xx response"""
+    if not response.is_success:
+        raise PhysioAssistAPIError(response)
+
+
+# ============================================================================
+# Caching
+# ============================================================================
+
+class _ClientCache:
+    """Template LRU and library stats shared by the sync and async clients
+
+    The sync client passes a threading.Lock since it may be shared across
+    threads; the async client runs on one event loop and needs none.
+    """
+
+    def __init__(self, lock: AbstractContextManager | None = None):
+        self._lock = lock if lock is not None else nullcontext()
+        self._templates: OrderedDict[str, ExerciseTemplate] = OrderedDict()
+        self._library_stats: tuple[float, bytes] | None = None  # (fetched_at, body)
+
+    def get_template(self, template_id: str) -> ExerciseTemplate | None:
+        """Look up a cached template, marking it as recently used"""
+        with self._lock:
+            template = self._templates.get(template_id)
+            if template is not None:
+                self._templates.move_to_end(template_id)
+        return template
+
+    def put_template(self, template: ExerciseTemplate) -> ExerciseTemplate:
+        """Remember a template, evicting the least recently used one when full"""
+        with self._lock:
+            self._templates[template.id] = template
+            self._templates.move_to_end(template.id)
+            if len(self._templates) > TEMPLATE_CACHE_SIZE:
+                self._templates.popitem(last=False)
+        return template
+
+    def split(
+        self,
+        template_ids: Sequence[str]
+    ) -> tuple[dict[str, ExerciseTemplate], list[str]]:
+        """Partition unique template IDs into cached templates and IDs to fetch"""
+        found: dict[str, ExerciseTemplate] = {}
+        missing: list[str] = []
+        with self._lock:
+            for template_id in dict.fromkeys(template_ids):
+                template = self._templates.get(template_id)
+                if template is None:
+                    missing.append(template_id)
+                else:
+                    self._templates.move_to_end(template_id)
+                    found[template_id] = template
+        return found, missing
+
+    def get_library_stats(self) -> dict | None:
+        """A fresh copy of the stats if fetched within LIBRARY_STATS_TTL
+
+        The response body is kept rather than the decoded dict, so callers can
+        modify what they get back without affecting each other.
+        """
+        cached = self._library_stats
+        if cached is None or time.monotonic() - cached[0] >= LIBRARY_STATS_TTL:
+            return None
+        return msgspec.json.decode(cached[1])
+
+    def put_library_stats(self, body: bytes) -> None:
+        """Remember a library stats response body"""
+        self._library_stats = (time.monotonic(), body)
+
+    def clear(self) -> None:
+        """Drop cached templates and library statistics"""
+        with self._lock:
+            self._templates.clear()
+        self._library_stats = None
+
+
+def _requested_only(
+    template_ids: list[str],
+    templates: list[ExerciseTemplate]
+) -> list[ExerciseTemplate]:
+    """Drop templates that weren't asked for
+
+    Keeps a server that ignores ids= from filling the cache with unrelated
+    templates.
+    """
+    requested = set(template_ids)
+    return [template for template in templates if template.id in requested]
+
 
 class PhysioAssistClient:
-    """PhysioAssist API Client"""
+    """PhysioAssist API Client
+
+    Instances are thread-safe. Servers that handle many requests should share
+    one client per API key via get_client() rather than building one per
+    request, so pooled connections and cached templates are reused.
+    """
 
     def __init__(self, api_key: str, base_url: str = "https://api.physioassist.com/v1"):
         self.api_key = api_key
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-API-Key": api_key,
-            "Content-Type": "application/json"
-        })
+        # One HTTP/2 connection multiplexes concurrent requests, so fan-out
+        # calls (e.g. a template lookup per prescription) share a TLS session.
+        # httpx's default Accept-Encoding already lists every encoding it can
+        # decode (br via the brotli extra), which matters for repetitive JSON
+        # list responses.
+        self.session = httpx.Client(
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json"
+            },
+            http2=True,
+            limits=POOL_LIMITS,
+            follow_redirects=True
+        )
+        self._cache = _ClientCache(threading.Lock())
+
+    def clear_cache(self) -> None:
+        """Drop cached templates and library statistics"""
+        self._cache.clear()
 
     # ========================================================================
     # Template Management
@@ -86,73 +340,80 @@ class PhysioAssistClient:
 
     def list_templates(
         self,
-        category: Optional[ExerciseCategory] = None,
-        difficulty_min: Optional[int] = None,
-        difficulty_max: Optional[int] = None,
-        search: Optional[str] = None,
+        category: ExerciseCategory | str | None = None,
+        difficulty_min: int | None = None,
+        difficulty_max: int | None = None,
+        search: str | None = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> Dict:
-        """List exercise templates with optional filters"""
-        params = {
-            "limit": limit,
-            "offset": offset
-        }
-
-        if category:
-            params["category"] = category.value
-        if difficulty_min:
-            params["difficulty_min"] = difficulty_min
-        if difficulty_max:
-            params["difficulty_max"] = difficulty_max
-        if search:
-            params["search"] = search
+        offset: int = 0,
+        fields: Sequence[str] | None = None
+    ) -> dict:
+        """List exercise templates with optional filters, as decoded JSON
+
+        Pass fields (e.g. ["id", "name"]) to have the server return only those
+        keys for each template.
+        """
+        params = _compact((
+            ("limit", limit),
+            ("offset", offset),
+            ("category", _enum_param(category, ExerciseCategory, _VALID_CATEGORIES, "category")),
+            ("difficulty_min", difficulty_min),
+            ("difficulty_max", difficulty_max),
+            ("search", search),
+            ("fields", _join(fields))
+        ))
 
         response = self.session.get(f"{self.base_url}/templates", params=params)
-        response.raise_for_status()
-        return response.json()
+        _check(response)
+        return msgspec.json.decode(response.content)
 
     def get_template(self, template_id: str) -> ExerciseTemplate:
-        """Get a specific template by ID"""
+        """Get a specific template by ID (served from cache when possible)"""
+        cached = self._cache.get_template(template_id)
+        if cached is not None:
+            return cached
+
         response = self.session.get(f"{self.base_url}/templates/{template_id}")
-        response.raise_for_status()
-        data = response.json()
-
-        return ExerciseTemplate(
-            id=data["id"],
-            name=data["name"],
-            description=data["description"],
-            category=data["category"],
-            difficulty=data["difficulty"],
-            body_region=data["bodyRegion"],
-            primary_joints=data["primaryJoints"],
-            estimated_duration=data["estimatedDuration"],
-            recommended_reps=data["recommendedReps"],
-            recommended_sets=data["recommendedSets"],
-            patient_instructions=data["patientInstructions"],
-            active=data["active"]
+        _check(response)
+        return self._cache.put_template(_template_decoder.decode(response.content))
+
+    def get_template_raw(self, template_id: str) -> dict:
+        """Get a specific template as decoded JSON, bypassing the cache"""
+        response = self.session.get(f"{self.base_url}/templates/{template_id}")
+        _check(response)
+        return msgspec.json.decode(response.content)
+
+    def get_templates_bulk(self, template_ids: Sequence[str]) -> dict[str, ExerciseTemplate]:
+        """Get several templates by ID, keyed by ID
+
+        Cached templates are served from memory and the rest are fetched with
+        GET /templates?ids=..., one request per TEMPLATE_BATCH_SIZE IDs. IDs
+        the API doesn't know are left out of the result.
+        """
+        found, missing = self._cache.split(template_ids)
+        for batch in _batches(missing, TEMPLATE_BATCH_SIZE):
+            for template in self._get_templates_batch(batch):
+                found[template.id] = self._cache.put_template(template)
+        return found
+
+    def _get_templates_batch(self, template_ids: list[str]) -> list[ExerciseTemplate]:
+        """Fetch one batch of templates with a single ids= request"""
+        response = self.session.get(
+            f"{self.base_url}/templates",
+            params={"ids": ",".join(template_ids), "limit": len(template_ids)}
         )
+        _check(response)
+        templates = _template_page_decoder.decode(response.content).templates
+        return _requested_only(template_ids, templates)
 
-    def create_template(self, template_data: Dict) -> ExerciseTemplate:
+    def create_template(self, template_data: dict) -> ExerciseTemplate:
         """Create a new exercise template (therapist/admin only)"""
-        response = self.session.post(f"{self.base_url}/templates", json=template_data)
-        response.raise_for_status()
-        data = response.json()
-
-        return ExerciseTemplate(
-            id=data["id"],
-            name=data["name"],
-            description=data["description"],
-            category=data["category"],
-            difficulty=data["difficulty"],
-            body_region=data["bodyRegion"],
-            primary_joints=data["primaryJoints"],
-            estimated_duration=data["estimatedDuration"],
-            recommended_reps=data["recommendedReps"],
-            recommended_sets=data["recommendedSets"],
-            patient_instructions=data["patientInstructions"],
-            active=data["active"]
+        response = self.session.post(
+            f"{self.base_url}/templates",
+            content=msgspec.json.encode(template_data)
         )
+        _check(response)
+        return self._cache.put_template(_template_decoder.decode(response.content))
 
     # ========================================================================
     # Prescription Management
@@ -164,155 +425,455 @@ class PhysioAssistClient:
         patient_id: str,
         therapist_id: str,
         frequency_per_week: int,
-        reps: Optional[int] = None,
-        sets: Optional[int] = None,
-        custom_instructions: Optional[str] = None,
-        primary_joint_focus: Optional[str] = None
+        reps: int | None = None,
+        sets: int | None = None,
+        custom_instructions: str | None = None,
+        primary_joint_focus: str | None = None
     ) -> ExercisePrescription:
         """Prescribe an exercise to a patient"""
-        data = {
-            "templateId": template_id,
-            "patientId": patient_id,
-            "therapistId": therapist_id,
-            "frequencyPerWeek": frequency_per_week
-        }
-
-        if reps:
-            data["reps"] = reps
-        if sets:
-            data["sets"] = sets
-        if custom_instructions:
-            data["customInstructions"] = custom_instructions
-        if primary_joint_focus:
-            data["primaryJointFocus"] = primary_joint_focus
-
-        response = self.session.post(f"{self.base_url}/prescriptions", json=data)
-        response.raise_for_status()
-        result = response.json()
-
-        return ExercisePrescription(
-            id=result["id"],
-            template_id=result["templateId"],
-            patient_id=result["patientId"],
-            therapist_id=result["therapistId"],
-            prescribed_at=result["prescribedAt"],
-            start_date=result["startDate"],
-            reps=result["reps"],
-            sets=result["sets"],
-            frequency_per_week=result["frequencyPerWeek"],
-            status=result["status"],
-            completion_percent=result["completionPercent"]
+        data = _compact((
+            ("templateId", template_id),
+            ("patientId", patient_id),
+            ("therapistId", therapist_id),
+            ("frequencyPerWeek", frequency_per_week),
+            ("reps", reps),
+            ("sets", sets),
+            ("customInstructions", custom_instructions),
+            ("primaryJointFocus", primary_joint_focus)
+        ))
+
+        response = self.session.post(
+            f"{self.base_url}/prescriptions",
+            content=msgspec.json.encode(data)
         )
+        _check(response)
+        return _prescription_decoder.decode(response.content)
 
     def get_prescription(self, prescription_id: str) -> ExercisePrescription:
         """Get a specific prescription by ID"""
         response = self.session.get(f"{self.base_url}/prescriptions/{prescription_id}")
-        response.raise_for_status()
-        data = response.json()
-
-        return ExercisePrescription(
-            id=data["id"],
-            template_id=data["templateId"],
-            patient_id=data["patientId"],
-            therapist_id=data["therapistId"],
-            prescribed_at=data["prescribedAt"],
-            start_date=data["startDate"],
-            reps=data["reps"],
-            sets=data["sets"],
-            frequency_per_week=data["frequencyPerWeek"],
-            status=data["status"],
-            completion_percent=data["completionPercent"]
-        )
+        _check(response)
+        return _prescription_decoder.decode(response.content)
+
+    def get_prescription_raw(self, prescription_id: str) -> dict:
+        """Get a specific prescription as decoded JSON"""
+        response = self.session.get(f"{self.base_url}/prescriptions/{prescription_id}")
+        _check(response)
+        return msgspec.json.decode(response.content)
 
     def update_prescription(
         self,
         prescription_id: str,
-        status: Optional[PrescriptionStatus] = None,
-        completion_percent: Optional[int] = None,
-        therapist_notes: Optional[str] = None
+        status: PrescriptionStatus | str | None = None,
+        completion_percent: int | None = None,
+        therapist_notes: str | None = None
     ) -> ExercisePrescription:
         """Update prescription status or notes"""
-        data = {}
-
-        if status:
-            data["status"] = status.value
-        if completion_percent is not None:
-            data["completionPercent"] = completion_percent
-        if therapist_notes:
-            data["therapistNotes"] = therapist_notes
+        data = _compact((
+            ("status", _enum_param(status, PrescriptionStatus, _VALID_STATUSES, "status")),
+            ("completionPercent", completion_percent),
+            ("therapistNotes", therapist_notes)
+        ))
 
         response = self.session.patch(
             f"{self.base_url}/prescriptions/{prescription_id}",
-            json=data
-        )
-        response.raise_for_status()
-        result = response.json()
-
-        return ExercisePrescription(
-            id=result["id"],
-            template_id=result["templateId"],
-            patient_id=result["patientId"],
-            therapist_id=result["therapistId"],
-            prescribed_at=result["prescribedAt"],
-            start_date=result["startDate"],
-            reps=result["reps"],
-            sets=result["sets"],
-            frequency_per_week=result["frequencyPerWeek"],
-            status=result["status"],
-            completion_percent=result["completionPercent"]
+            content=msgspec.json.encode(data)
         )
+        _check(response)
+        return _prescription_decoder.decode(response.content)
 
     def cancel_prescription(self, prescription_id: str) -> bool:
         """Cancel a prescription"""
         response = self.session.delete(f"{self.base_url}/prescriptions/{prescription_id}")
         return response.status_code == 204
 
+    def get_patient_prescriptions_raw(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        fields: Sequence[str] | None = None
+    ) -> dict:
+        """Get one page of prescriptions for a patient as decoded JSON
+
+        Pass fields to have the server return only those keys for each
+        prescription.
+        """
+        response = self.session.get(
+            f"{self.base_url}/patients/{patient_id}/prescriptions",
+            params=_prescription_page_params(status, limit, offset, fields)
+        )
+        _check(response)
+        return msgspec.json.decode(response.content)
+
     def get_patient_prescriptions(
         self,
         patient_id: str,
-        status: Optional[PrescriptionStatus] = None,
+        status: PrescriptionStatus | str | None = None,
         limit: int = 50,
         offset: int = 0
-    ) -> List[ExercisePrescription]:
-        """Get all prescriptions for a patient"""
-        params = {"limit": limit, "offset": offset}
-
-        if status:
-            params["status"] = status.value
+    ) -> list[ExercisePrescription]:
+        """Get one page of prescriptions for a patient"""
+        page = self._get_prescriptions_page(patient_id, status, limit, offset)
+        return page.prescriptions
 
+    def _get_prescriptions_page(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None,
+        limit: int,
+        offset: int
+    ) -> _PrescriptionPage:
+        """Fetch one page of prescriptions along with the reported total"""
         response = self.session.get(
             f"{self.base_url}/patients/{patient_id}/prescriptions",
-            params=params
+            params=_prescription_page_params(status, limit, offset)
         )
-        response.raise_for_status()
-        data = response.json()
-
-        return [
-            ExercisePrescription(
-                id=p["id"],
-                template_id=p["templateId"],
-                patient_id=p["patientId"],
-                therapist_id=p["therapistId"],
-                prescribed_at=p["prescribedAt"],
-                start_date=p["startDate"],
-                reps=p["reps"],
-                sets=p["sets"],
-                frequency_per_week=p["frequencyPerWeek"],
-                status=p["status"],
-                completion_percent=p["completionPercent"]
-            )
-            for p in data["prescriptions"]
-        ]
+        _check(response)
+        return _prescription_page_decoder.decode(response.content)
+
+    def iter_patient_prescriptions(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None = None,
+        page_size: int = 200
+    ) -> Iterator[ExercisePrescription]:
+        """Yield every prescription for a patient, fetching one page at a time
+
+        Paging advances by the number of items actually returned, so a server
+        that caps limit below page_size is still read to the end. Iteration
+        stops at the reported total, or at an empty page.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        offset = 0
+        while True:
+            page = self._get_prescriptions_page(patient_id, status, page_size, offset)
+            yield from page.prescriptions
+            offset += len(page.prescriptions)
+            if not page.prescriptions or (page.total is not None and offset >= page.total):
+                return
 
     # ========================================================================
     # Library Statistics
     # ========================================================================
 
-    def get_library_stats(self) -> Dict:
-        """Get template library statistics"""
+    def get_library_stats(self) -> dict:
+        """Get template library statistics (cached for LIBRARY_STATS_TTL seconds)
+
+        Every call returns a fresh dict that callers can modify freely.
+        """
+        stats = self._cache.get_library_stats()
+        if stats is not None:
+            return stats
+
         response = self.session.get(f"{self.base_url}/library/stats")
-        response.raise_for_status()
-        return response.json()
+        _check(response)
+        self._cache.put_library_stats(response.content)
+        return msgspec.json.decode(response.content)
+
+
+# One client per (api_key, base_url) for the whole process
+_CLIENTS: dict[tuple[str, str], PhysioAssistClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(
+    api_key: str,
+    base_url: str = "https://api.physioassist.com/v1"
+) -> PhysioAssistClient:
+    """Get the shared client for an API key, creating it on first use"""
+    key = (api_key, base_url)
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = _CLIENTS[key] = PhysioAssistClient(api_key, base_url)
+    return client
+
+
+class AsyncPhysioAssistClient:
+    """PhysioAssist API Client for asyncio applications"""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.physioassist.com/v1",
+        max_concurrency: int = 16
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.session = httpx.AsyncClient(
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json"
+            },
+            http2=True,
+            limits=POOL_LIMITS,
+            follow_redirects=True
+        )
+        self._cache = _ClientCache()
+        # Caps in-flight fan-out requests so bulk calls stay within the pool
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections"""
+        await self.session.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop cached templates and library statistics"""
+        self._cache.clear()
+
+    # ========================================================================
+    # Template Management
+    # ========================================================================
+
+    async def list_templates(
+        self,
+        category: ExerciseCategory | str | None = None,
+        difficulty_min: int | None = None,
+        difficulty_max: int | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        fields: Sequence[str] | None = None
+    ) -> dict:
+        """List exercise templates with optional filters, as decoded JSON
+
+        Pass fields (e.g. ["id", "name"]) to have the server return only those
+        keys for each template.
+        """
+        params = _compact((
+            ("limit", limit),
+            ("offset", offset),
+            ("category", _enum_param(category, ExerciseCategory, _VALID_CATEGORIES, "category")),
+            ("difficulty_min", difficulty_min),
+            ("difficulty_max", difficulty_max),
+            ("search", search),
+            ("fields", _join(fields))
+        ))
+
+        response = await self.session.get(f"{self.base_url}/templates", params=params)
+        _check(response)
+        return msgspec.json.decode(response.content)
+
+    async def get_template(self, template_id: str) -> ExerciseTemplate:
+        """Get a specific template by ID (served from cache when possible)"""
+        cached = self._cache.get_template(template_id)
+        if cached is not None:
+            return cached
+
+        response = await self.session.get(f"{self.base_url}/templates/{template_id}")
+        _check(response)
+        return self._cache.put_template(_template_decoder.decode(response.content))
+
+    async def get_template_raw(self, template_id: str) -> dict:
+        """Get a specific template as decoded JSON, bypassing the cache"""
+        response = await self.session.get(f"{self.base_url}/templates/{template_id}")
+        _check(response)
+        return msgspec.json.decode(response.content)
+
+    async def get_templates_bulk(
+        self,
+        template_ids: Sequence[str]
+    ) -> dict[str, ExerciseTemplate]:
+        """Get several templates by ID, keyed by ID
+
+        Cached templates are served from memory and the rest are fetched with
+        GET /templates?ids=..., one request per TEMPLATE_BATCH_SIZE IDs, sent
+        concurrently. IDs the API doesn't know are left out of the result.
+        """
+        found, missing = self._cache.split(template_ids)
+
+        async def fetch(batch: list[str]) -> list[ExerciseTemplate]:
+            async with self._semaphore:
+                return await self._get_templates_batch(batch)
+
+        batches = _batches(missing, TEMPLATE_BATCH_SIZE)
+        for templates in await asyncio.gather(*map(fetch, batches)):
+            for template in templates:
+                found[template.id] = self._cache.put_template(template)
+        return found
+
+    async def _get_templates_batch(self, template_ids: list[str]) -> list[ExerciseTemplate]:
+        """Fetch one batch of templates with a single ids= request"""
+        response = await self.session.get(
+            f"{self.base_url}/templates",
+            params={"ids": ",".join(template_ids), "limit": len(template_ids)}
+        )
+        _check(response)
+        templates = _template_page_decoder.decode(response.content).templates
+        return _requested_only(template_ids, templates)
+
+    async def create_template(self, template_data: dict) -> ExerciseTemplate:
+        """Create a new exercise template (therapist/admin only)"""
+        response = await self.session.post(
+            f"{self.base_url}/templates",
+            content=msgspec.json.encode(template_data)
+        )
+        _check(response)
+        return self._cache.put_template(_template_decoder.decode(response.content))
+
+    # ========================================================================
+    # Prescription Management
+    # ========================================================================
+
+    async def create_prescription(
+        self,
+        template_id: str,
+        patient_id: str,
+        therapist_id: str,
+        frequency_per_week: int,
+        reps: int | None = None,
+        sets: int | None = None,
+        custom_instructions: str | None = None,
+        primary_joint_focus: str | None = None
+    ) -> ExercisePrescription:
+        """Prescribe an exercise to a patient"""
+        data = _compact((
+            ("templateId", template_id),
+            ("patientId", patient_id),
+            ("therapistId", therapist_id),
+            ("frequencyPerWeek", frequency_per_week),
+            ("reps", reps),
+            ("sets", sets),
+            ("customInstructions", custom_instructions),
+            ("primaryJointFocus", primary_joint_focus)
+        ))
+
+        response = await self.session.post(
+            f"{self.base_url}/prescriptions",
+            content=msgspec.json.encode(data)
+        )
+        _check(response)
+        return _prescription_decoder.decode(response.content)
+
+    async def get_prescription(self, prescription_id: str) -> ExercisePrescription:
+        """Get a specific prescription by ID"""
+        response = await self.session.get(f"{self.base_url}/prescriptions/{prescription_id}")
+        _check(response)
+        return _prescription_decoder.decode(response.content)
+
+    async def get_prescription_raw(self, prescription_id: str) -> dict:
+        """Get a specific prescription as decoded JSON"""
+        response = await self.session.get(f"{self.base_url}/prescriptions/{prescription_id}")
+        _check(response)
+        return msgspec.json.decode(response.content)
+
+    async def update_prescription(
+        self,
+        prescription_id: str,
+        status: PrescriptionStatus | str | None = None,
+        completion_percent: int | None = None,
+        therapist_notes: str | None = None
+    ) -> ExercisePrescription:
+        """Update prescription status or notes"""
+        data = _compact((
+            ("status", _enum_param(status, PrescriptionStatus, _VALID_STATUSES, "status")),
+            ("completionPercent", completion_percent),
+            ("therapistNotes", therapist_notes)
+        ))
+
+        response = await self.session.patch(
+            f"{self.base_url}/prescriptions/{prescription_id}",
+            content=msgspec.json.encode(data)
+        )
+        _check(response)
+        return _prescription_decoder.decode(response.content)
+
+    async def cancel_prescription(self, prescription_id: str) -> bool:
+        """Cancel a prescription"""
+        response = await self.session.delete(f"{self.base_url}/prescriptions/{prescription_id}")
+        return response.status_code == 204
+
+    async def get_patient_prescriptions_raw(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        fields: Sequence[str] | None = None
+    ) -> dict:
+        """Get one page of prescriptions for a patient as decoded JSON
+
+        Pass fields to have the server return only those keys for each
+        prescription.
+        """
+        response = await self.session.get(
+            f"{self.base_url}/patients/{patient_id}/prescriptions",
+            params=_prescription_page_params(status, limit, offset, fields)
+        )
+        _check(response)
+        return msgspec.json.decode(response.content)
+
+    async def get_patient_prescriptions(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> list[ExercisePrescription]:
+        """Get one page of prescriptions for a patient"""
+        page = await self._get_prescriptions_page(patient_id, status, limit, offset)
+        return page.prescriptions
+
+    async def _get_prescriptions_page(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None,
+        limit: int,
+        offset: int
+    ) -> _PrescriptionPage:
+        """Fetch one page of prescriptions along with the reported total"""
+        response = await self.session.get(
+            f"{self.base_url}/patients/{patient_id}/prescriptions",
+            params=_prescription_page_params(status, limit, offset)
+        )
+        _check(response)
+        return _prescription_page_decoder.decode(response.content)
+
+    async def iter_patient_prescriptions(
+        self,
+        patient_id: str,
+        status: PrescriptionStatus | str | None = None,
+        page_size: int = 200
+    ) -> AsyncIterator[ExercisePrescription]:
+        """Yield every prescription for a patient, fetching one page at a time
+
+        Paging advances by the number of items actually returned, so a server
+        that caps limit below page_size is still read to the end. Iteration
+        stops at the reported total, or at an empty page.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        offset = 0
+        while True:
+            page = await self._get_prescriptions_page(patient_id, status, page_size, offset)
+            for prescription in page.prescriptions:
+                yield prescription
+            offset += len(page.prescriptions)
+            if not page.prescriptions or (page.total is not None and offset >= page.total):
+                return
+
+    # ========================================================================
+    # Library Statistics
+    # ========================================================================
+
+    async def get_library_stats(self) -> dict:
+        """Get template library statistics (cached for LIBRARY_STATS_TTL seconds)
+
+        Every call returns a fresh dict that callers can modify freely.
+        """
+        stats = self._cache.get_library_stats()
+        if stats is not None:
+            return stats
+
+        response = await self.session.get(f"{self.base_url}/library/stats")
+        _check(response)
+        self._cache.put_library_stats(response.content)
+        return msgspec.json.decode(response.content)
 
 
 # ============================================================================
@@ -322,14 +883,15 @@ class PhysioAssistClient:
 def main():
     # Initialize client with API key
     api_key = "your_api_key_here"  # Replace with actual API key
-    client = PhysioAssistClient(api_key)
+    client = get_client(api_key)
 
     # Example 1: List shoulder strength exercises
     print("=== Example 1: List shoulder strength exercises ===")
     templates = client.list_templates(
         category=ExerciseCategory.STRENGTH,
         search="shoulder",
-        limit=10
+        limit=10,
+        fields=["name", "difficulty"]
     )
     print(f"Found {templates['total']} templates")
     for template in templates['templates']:
@@ -363,9 +925,28 @@ def main():
     #     status=PrescriptionStatus.ACTIVE
     # )
     # print(f"Active prescriptions: {len(prescriptions)}")
+    # # One request for all referenced templates instead of one per prescription
+    # templates = client.get_templates_bulk([p.template_id for p in prescriptions])
     # for prescription in prescriptions:
-    #     template = client.get_template(prescription.template_id)
-    #     print(f"  - {template.name}: {prescription.completion_percent}% complete")
+    #     template = templates.get(prescription.template_id)
+    #     name = template.name if template else f"Unknown template {prescription.template_id}"
+    #     print(f"  - {name}: {prescription.completion_percent}% complete")
+    #
+    # The same with AsyncPhysioAssistClient:
+    # async def show_active(client: AsyncPhysioAssistClient):
+    #     prescriptions = await client.get_patient_prescriptions(
+    #         patient_id="patient_456",
+    #         status=PrescriptionStatus.ACTIVE
+    #     )
+    #     templates = await client.get_templates_bulk(
+    #         [p.template_id for p in prescriptions]
+    #     )
+    #     for prescription in prescriptions:
+    #         template = templates.get(prescription.template_id)
+    #         name = template.name if template else f"Unknown template {prescription.template_id}"
+    #         print(f"  - {name}: {prescription.completion_percent}% complete")
+    #     await client.aclose()
+    # asyncio.run(show_active(AsyncPhysioAssistClient(api_key)))
 
     # Example 5: Update prescription progress
     print("\n=== Example 5: Update prescription progress ===")